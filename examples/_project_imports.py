@@ -1,4 +1,4 @@
-from importlib.util import module_from_spec, spec_from_file_location
+from importlib import import_module
 from pathlib import Path
 import sys
 
@@ -6,16 +6,12 @@ import sys
 def _load_local_package(package_name: str, init_file: Path) -> None:
     if package_name in sys.modules:
         return
-    spec = spec_from_file_location(
-        package_name,
-        str(init_file),
-        submodule_search_locations=[str(init_file.parent)],
-    )
-    if spec is None or spec.loader is None:
-        raise ImportError(f"Cannot load local package: {package_name}")
-    module = module_from_spec(spec)
-    sys.modules[package_name] = module
-    spec.loader.exec_module(module)
+    # Put <project>/src first on sys.path so the regular import system (and its
+    # __pycache__ bytecode cache) loads the in-repo package instead of an installed one.
+    src_root = str(init_file.parent.parent)
+    if src_root not in sys.path:
+        sys.path.insert(0, src_root)
+    import_module(package_name)
 
 
 def use_project_packages() -> None:
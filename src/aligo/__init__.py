@@ -1,10 +1,6 @@
 """aligo"""
-from .types import *
-from .request import *
-from .response import *
-from .core import *
-from .apis import *
-from .core.Auth import logout
+import importlib as _importlib
+import sys as _sys
 
 __title__ = 'aligo'
 __description__ = 'apis lib for aliyundrive.'
@@ -15,3 +11,35 @@ __author_email__ = 'yimi.0822@qq.com'
 __license__ = 'Apache 2.0'
 __copyright__ = f'Copyright 2021-2022 {__author__}'
 __ide__ = 'PyCharm - https://www.jetbrains.com/pycharm/'
+
+# 与原先 `from .xxx import *` 的顺序一致, 后导入的同名对象覆盖先导入的
+_STAR_MODULES = ('.types', '.request', '.response', '.core', '.apis')
+
+
+def _load():
+    """导入整个 SDK (requests, qrcode, ...), 并把各子模块的公开名称挂到包上"""
+    namespace = globals()
+    for name in _STAR_MODULES:
+        module = _importlib.import_module(name, __name__)
+        public = getattr(module, '__all__', None) or [k for k in vars(module) if not k.startswith('_')]
+        namespace.update((k, getattr(module, k)) for k in public)
+    from .core.Auth import logout
+    namespace['logout'] = logout
+    return namespace
+
+
+if _sys.version_info < (3, 7):
+    # 模块级 __getattr__ (PEP 562) 需要 Python 3.7+
+    _load()
+else:
+    def __getattr__(name):
+        """首次访问 SDK 名称时才导入, `import aligo.cli` / `aligo --help` 因而无需加载 requests 等依赖"""
+        if name.startswith('__') and name != '__all__':
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+        namespace = _load()
+        if name == '__all__':
+            return [k for k in namespace if not k.startswith('_')]
+        try:
+            return namespace[name]
+        except KeyError:
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
@@ -12,17 +12,49 @@ if __name__ == "__main__" and (__package__ is None or __package__ == ""):
         sys.path.insert(0, src_dir)
 
 import argparse
+import functools
 import json
 import logging
 import re
-from typing import Optional, Tuple
-
-from aligo import Aligo, EMailConfig, __version__, logout
-
-
+import shlex
+import stat
+import threading
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+# The SDK import graph (requests, qrcode, MIME, ...) is only loaded by commands that talk to
+# the drive, so `--help`, `--version` and argument errors stay cheap.
+if TYPE_CHECKING:
+    from aligo import Aligo
+
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    orjson = None
+
+# (drive_id, canonical remote path) -> (file_id, type), least recently used first.
+# Entries are trusted for the life of the process (e.g. across `batch` lines) and are only
+# dropped by commands of this process that delete or move remote items (rm, mv, sync); the
+# cache assumes nothing else changes the drive concurrently.
+_PATH_CACHE_MAXSIZE = 4096
+_PATH_CACHE: "OrderedDict[Tuple[Optional[str], str], Tuple[str, str]]" = OrderedDict()
+_PATH_CACHE_LOCK = threading.Lock()
+
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+# Per-class answer to "does it have a callable to_dict", so leaves skip the attribute probe.
+_TO_DICT_TYPES: "weakref.WeakKeyDictionary[type, bool]" = weakref.WeakKeyDictionary()
+
+_SCHEME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*://")
+
+
+@functools.lru_cache(maxsize=1024)
 def _normalize_remote_path(path: str) -> str:
     value = (path or "/").strip()
-    if "://" in value:
+    if _SCHEME_RE.match(value) is not None:
         raise ValueError(f"unsupported remote path format: {value!r}; use filepath-like path such as '/tasks'")
     if ":" in value and not value.startswith("/"):
         raise ValueError(f"unsupported remote path format: {value!r}; use filepath-like path such as 'tasks'")
@@ -31,46 +63,171 @@ def _normalize_remote_path(path: str) -> str:
     return value
 
 
-def _build_client(args: argparse.Namespace) -> Aligo:
+def _build_client(args: argparse.Namespace) -> "Aligo":
     level = logging.DEBUG if args.debug else logging.INFO
     email = None
     if getattr(args, "email_to", None):
-        email = EMailConfig(
-            email=args.email_to,
-            user=args.email_user,
-            password=args.email_password,
-            host=args.email_host,
-            port=args.email_port,
-            content=args.email_content or "",
+        email = (
+            ("email", args.email_to),
+            ("user", args.email_user),
+            ("password", args.email_password),
+            ("host", args.email_host),
+            ("port", args.email_port),
+            ("content", args.email_content or ""),
         )
+    ali = _cached_client(args.profile, args.refresh_token, level, getattr(args, "port", None), email,
+                         not args.no_relogin)
+    # Resolve the default drive once so every downstream call (and the path cache key)
+    # sees the same concrete id instead of None.
+    if not getattr(args, "drive_id", None):
+        args.drive_id = ali.default_drive_id
+    return ali
+
+
+# One client per distinct login setup, so `batch` pays session setup and token refresh once.
+@functools.lru_cache(maxsize=None)
+def _cached_client(profile: str, refresh_token: Optional[str], level: int, port: Optional[int],
+                   email: Optional[Tuple[Tuple[str, object], ...]], re_login: bool) -> "Aligo":
+    from aligo import Aligo, EMailConfig
+
     return Aligo(
-        name=args.profile,
-        refresh_token=args.refresh_token,
+        name=profile,
+        refresh_token=refresh_token,
         level=level,
-        port=getattr(args, "port", None),
-        email=email,
-        re_login=not args.no_relogin,
+        port=port,
+        email=EMailConfig(**dict(email)) if email else None,
+        re_login=re_login,
     )
 
 
-def _resolve_remote_file(ali: Aligo, remote_path: str, drive_id: str = None):
-    path = _normalize_remote_path(remote_path)
+def _canonical_remote_path(path: str) -> str:
+    # Single spelling for cache keys: "/a//b/" and "a/b" both become "/a/b", root is "/".
+    return "/" + "/".join(part for part in path.split("/") if part)
+
+
+def _path_cache_get(drive_id: Optional[str], path: str) -> Optional[Tuple[str, str]]:
+    path = _canonical_remote_path(path)
+    with _PATH_CACHE_LOCK:
+        entry = _PATH_CACHE.get((drive_id, path))
+        if entry is not None:
+            _PATH_CACHE.move_to_end((drive_id, path))
+        return entry
+
+
+def _path_cache_put(drive_id: Optional[str], path: str, file_id: str, file_type: str):
+    path = _canonical_remote_path(path)
+    with _PATH_CACHE_LOCK:
+        _PATH_CACHE[(drive_id, path)] = (file_id, file_type)
+        _PATH_CACHE.move_to_end((drive_id, path))
+        while len(_PATH_CACHE) > _PATH_CACHE_MAXSIZE:
+            _PATH_CACHE.popitem(last=False)
+
+
+def _path_cache_forget(drive_id: Optional[str], path: str):
+    path = _canonical_remote_path(path)
+    prefix = path.rstrip("/") + "/"
+    with _PATH_CACHE_LOCK:
+        for key in [k for k in _PATH_CACHE if k[0] == drive_id and (k[1] == path or k[1].startswith(prefix))]:
+            del _PATH_CACHE[key]
+
+
+def _walk_remote_folders(ali: "Aligo", path: str, drive_id: str = None, create: bool = False):
+    # Start from the longest cached ancestor and cache every folder visited on the way down,
+    # so sibling lookups in the same process skip the shared prefix entirely.
+    parts = [part for part in path.strip("/").split("/") if part]
+    start, current_id = 0, "root"
+    for i in range(len(parts), 0, -1):
+        entry = _path_cache_get(drive_id, "/" + "/".join(parts[:i]))
+        if entry is not None and entry[1] == "folder":
+            start, current_id = i, entry[0]
+            break
+    if start == len(parts):
+        return ali.get_file(current_id, drive_id=drive_id)
+
+    folder = None
+    for i in range(start, len(parts)):
+        name = parts[i]
+        if create:
+            folder = ali.create_folder(
+                name=name, parent_file_id=current_id, drive_id=drive_id, check_name_mode="auto_rename"
+            )
+            # auto_rename may hand back "name(1)"; never cache that under the requested name.
+            cacheable = getattr(folder, "file_name", None) in (None, name)
+        else:
+            children = ali.get_file_list(parent_file_id=current_id, drive_id=drive_id, type="folder")
+            folder = next((child for child in children if child.name == name), None)
+            if folder is None:
+                return None
+            cacheable = True
+        current_id = folder.file_id
+        if cacheable:
+            _path_cache_put(drive_id, "/" + "/".join(parts[:i + 1]), current_id, "folder")
+    return folder
+
+
+def _remote_folder_id(ali: "Aligo", path: str, drive_id: str = None, create: bool = False) -> Optional[str]:
+    # Like `_walk_remote_folders` but only the id is needed, so a fully cached path costs no request.
+    key = _canonical_remote_path(path)
+    if key == "/":
+        return "root"
+    entry = _path_cache_get(drive_id, key)
+    if entry is not None and entry[1] == "folder":
+        return entry[0]
+    folder = _walk_remote_folders(ali, key, drive_id=drive_id, create=create)
+    return None if folder is None else folder.file_id
+
+
+def _find_child(ali: "Aligo", parent_id: str, path: str, name: str, drive_id: str = None,
+                file_types: Tuple[str, ...] = ("file", "folder")):
+    # Files win over folders of the same name, matching `get_file_by_path` then `get_folder_by_path`.
+    for file_type in file_types:
+        for item in ali.get_file_list(parent_file_id=parent_id, drive_id=drive_id, type=file_type):
+            if item.name == name:
+                _path_cache_put(drive_id, path, item.file_id, file_type)
+                return item
+    return None
+
+
+def _resolve_path_to_ids(
+        ali: "Aligo", remote_path: str, drive_id: str = None, file_types: Tuple[str, ...] = ("file", "folder")
+) -> Tuple[Optional[str], str, Optional[str]]:
+    # One walk to (parent_id, leaf_name, leaf_id): parent_id is None when the parent folder is
+    # missing, leaf_id is None when the parent has no child of `file_types` named leaf_name.
+    path = _canonical_remote_path(_normalize_remote_path(remote_path))
+    if path == "/":
+        return None, "", "root"
+    parent_path, _, name = path.rpartition("/")
+    parent_id = _remote_folder_id(ali, parent_path, drive_id=drive_id)
+    if parent_id is None:
+        return None, name, None
+    entry = _path_cache_get(drive_id, path)
+    if entry is not None and entry[1] in file_types:
+        return parent_id, name, entry[0]
+    item = _find_child(ali, parent_id, path, name, drive_id=drive_id, file_types=file_types)
+    return parent_id, name, None if item is None else item.file_id
+
+
+def _resolve_remote_file(ali: "Aligo", remote_path: str, drive_id: str = None):
+    path = _canonical_remote_path(_normalize_remote_path(remote_path))
     if path == "/":
         return ali.get_file("root", drive_id=drive_id)
-    file_obj = ali.get_file_by_path(path, drive_id=drive_id)
-    if file_obj is None:
-        # `get_file_by_path` only searches type='file'. Fallback to folder path.
-        file_obj = ali.get_folder_by_path(path, drive_id=drive_id, create_folder=False)
-    if file_obj is None:
+    entry = _path_cache_get(drive_id, path)
+    if entry is not None:
+        return ali.get_file(entry[0], drive_id=drive_id)
+
+    parent_path, _, name = path.rpartition("/")
+    parent_id = _remote_folder_id(ali, parent_path, drive_id=drive_id)
+    item = None if parent_id is None else _find_child(ali, parent_id, path, name, drive_id=drive_id)
+    if item is None:
         raise FileNotFoundError(f"remote path not found: {path}")
-    return file_obj
+    return item
 
 
-def _resolve_remote_folder(ali: Aligo, remote_path: str, drive_id: str = None, create: bool = False):
+def _resolve_remote_folder(ali: "Aligo", remote_path: str, drive_id: str = None, create: bool = False):
     path = _normalize_remote_path(remote_path)
     if path == "/":
         return ali.get_file("root", drive_id=drive_id)
-    folder = ali.get_folder_by_path(path, drive_id=drive_id, create_folder=create, check_name_mode="auto_rename")
+    folder = _walk_remote_folders(ali, path, drive_id=drive_id, create=create)
     if folder is None:
         raise FileNotFoundError(f"remote folder not found: {path}")
     if folder.type != "folder":
@@ -78,7 +235,7 @@ def _resolve_remote_folder(ali: Aligo, remote_path: str, drive_id: str = None, c
     return folder
 
 
-def _get_child_folders(ali: Aligo, parent_file_id: str, drive_id: str = None):
+def _get_child_folders(ali: "Aligo", parent_file_id: str, drive_id: str = None):
     return list(ali.get_file_list(parent_file_id=parent_file_id, drive_id=drive_id, type="folder"))
 
 
@@ -94,7 +251,7 @@ def _folder_id(folder) -> Optional[str]:
     return getattr(folder, "file_id", None)
 
 
-def _resolve_sync_remote_folder(ali: Aligo, remote_path: str, drive_id: str = None):
+def _resolve_sync_remote_folder(ali: "Aligo", remote_path: str, drive_id: str = None):
     path = _normalize_remote_path(remote_path)
     if path == "/":
         return ali.get_file("root", drive_id=drive_id)
@@ -137,61 +294,247 @@ def _resolve_sync_remote_folder(ali: Aligo, remote_path: str, drive_id: str = No
 
 
 def _resolve_target_parent_and_name(
-        ali: Aligo, destination: str, drive_id: str = None
+        ali: "Aligo", destination: str, drive_id: str = None
 ) -> Tuple[str, Optional[str]]:
     dst = _normalize_remote_path(destination)
     if dst == "/":
         return "root", None
 
     if destination.endswith("/"):
-        folder = _resolve_remote_folder(ali, dst, drive_id=drive_id, create=True)
-        return folder.file_id, None
-
-    maybe_folder = ali.get_folder_by_path(dst, drive_id=drive_id, create_folder=False)
-    if maybe_folder and maybe_folder.type == "folder":
-        return maybe_folder.file_id, None
-
-    parent_path, new_name = os.path.split(dst.rstrip("/"))
-    parent = _resolve_remote_folder(ali, parent_path or "/", drive_id=drive_id, create=True)
-    return parent.file_id, new_name or None
+        return _remote_folder_id(ali, dst, drive_id=drive_id, create=True), None
+
+    parent_id, new_name, folder_id = _resolve_path_to_ids(ali, dst, drive_id=drive_id, file_types=("folder",))
+    if folder_id is not None:
+        return folder_id, None
+    if parent_id is None:
+        head, _, new_name = dst.rstrip("/").rpartition("/")
+        parent_id = _remote_folder_id(ali, head or "/", drive_id=drive_id, create=True)
+    return parent_id, new_name or None
+
+
+def _resolve_source_id(ali: "Aligo", source: str, drive_id: str = None) -> str:
+    _, _, file_id = _resolve_path_to_ids(ali, source, drive_id=drive_id)
+    if file_id is None:
+        raise FileNotFoundError(f"remote path not found: {_normalize_remote_path(source)}")
+    return file_id
+
+
+def _cancel_futures(futures: Iterable):
+    # Without this, leaving a `with ThreadPoolExecutor` on an error (or Ctrl-C) still waits
+    # for every queued job; only jobs already running are left to finish.
+    for future in futures:
+        future.cancel()
+
+
+def _raise_walk_error(exc: OSError):
+    raise exc
+
+
+def _upload_tree(ali: "Aligo", local_root: str, parent_file_id: str, drive_id: str = None,
+                 check_name_mode: str = "auto_rename", concurrency: int = 8) -> List:
+    # Folder skeleton is created up front on the calling thread (os.walk is top-down,
+    # so parents always exist before children); only file uploads go to the pool.
+    # Like `upload_folder`, symlinked folders are followed, unreadable folders raise, and the
+    # result nests each sub folder as {name: [...]} after the files of its parent.
+    folder_ids: Dict[str, str] = {}
+    trees: Dict[str, List] = {}
+    jobs: List[Tuple[str, str, List, int]] = []
+    root_name = os.path.basename(local_root)
+    for dir_path, dir_names, file_names in os.walk(local_root, followlinks=True, onerror=_raise_walk_error):
+        rel = os.path.relpath(dir_path, local_root)
+        trees[rel] = entries = []
+        if rel == ".":
+            name, parent_id = root_name, parent_file_id
+        else:
+            name, parent_rel = os.path.basename(dir_path), os.path.dirname(rel) or "."
+            parent_id = folder_ids[parent_rel]
+            trees[parent_rel].append({name: entries})
+        folder = ali.create_folder(name=name, parent_file_id=parent_id, drive_id=drive_id, check_name_mode="refuse")
+        folder_ids[rel] = _folder_id(folder)
+        dir_names.sort()
+        for file_name in sorted(file_names):
+            jobs.append((os.path.join(dir_path, file_name), folder_ids[rel], entries, len(entries)))
+            entries.append(None)
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = {
+            executor.submit(
+                ali.upload_file,
+                local_file,
+                parent_file_id=folder_id,
+                drive_id=drive_id,
+                check_name_mode=check_name_mode,
+            ): (entries, index)
+            for local_file, folder_id, entries, index in jobs
+        }
+        try:
+            for future in as_completed(futures):
+                entries, index = futures[future]
+                entries[index] = future.result()
+        except BaseException:
+            _cancel_futures(futures)
+            raise
+    return trees["."]
+
+
+def _download_tree(ali: "Aligo", folder, local_dir: str, drive_id: str = None, concurrency: int = 8) -> str:
+    # Mirrors download_folder layout: the remote folder becomes a child of local_dir
+    # unless it is the drive root. Listing and downloading run on separate pools so
+    # the BFS keeps discovering folders while earlier files are still transferring.
+    root_dir = local_dir
+    if folder.file_id != "root":
+        root_dir = os.path.join(local_dir, ali._del_special_symbol(folder.name))
+    workers = max(1, concurrency)
+    # per-file tqdm bars from parallel workers would interleave with the [n/N] lines
+    progress = getattr(ali, "_DOWNLOAD_PROGRESS", True)
+    if workers > 1:
+        ali._DOWNLOAD_PROGRESS = False
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as lister, ThreadPoolExecutor(max_workers=workers) as downloader:
+            pending = [(folder.file_id, root_dir)]
+            listings, downloads = {}, []
+            try:
+                while pending:
+                    listings = {}
+                    for folder_id, folder_dir in pending:
+                        os.makedirs(folder_dir, exist_ok=True)
+                        listing = lister.submit(ali.get_file_list, parent_file_id=folder_id, drive_id=drive_id)
+                        listings[listing] = folder_dir
+                    pending = []
+                    for future in as_completed(listings):
+                        folder_dir = listings[future]
+                        for item in future.result():
+                            if item.type == "folder":
+                                child_dir = os.path.join(folder_dir, ali._del_special_symbol(item.name))
+                                pending.append((item.file_id, child_dir))
+                            else:
+                                downloads.append(downloader.submit(ali.download_file, file=item, local_folder=folder_dir))
+
+                for done, future in enumerate(as_completed(downloads), start=1):
+                    print(f"[{done}/{len(downloads)}] {future.result()}", file=sys.stderr)
+            except BaseException:
+                _cancel_futures(list(listings) + downloads)
+                raise
+    finally:
+        ali._DOWNLOAD_PROGRESS = progress
+    return os.path.abspath(root_dir)
+
+
+def _has_to_dict(cls: type) -> bool:
+    try:
+        return _TO_DICT_TYPES[cls]
+    except KeyError:
+        result = _TO_DICT_TYPES[cls] = callable(getattr(cls, "to_dict", None))
+        return result
 
 
 def _serialize(data):
-    if isinstance(data, list):
-        return [_serialize(item) for item in data]
-    if isinstance(data, dict):
-        return {k: _serialize(v) for k, v in data.items()}
-    to_dict = getattr(data, "to_dict", None)
-    if callable(to_dict):
-        return _serialize(to_dict())
-    return data
+    if type(data) in _SCALAR_TYPES:
+        return data
+    # Explicit worklist instead of recursion: each entry is (value, container, key) and the
+    # converted value is stored into container[key]; containers are pre-sized/pre-keyed so
+    # list order and dict key order are preserved regardless of pop order.
+    root = [None]
+    stack = deque([(data, root, 0)])
+    while stack:
+        value, container, key = stack.pop()
+        while type(value) not in _SCALAR_TYPES and not isinstance(value, (list, dict)) and _has_to_dict(type(value)):
+            value = value.to_dict()
+        if isinstance(value, list):
+            out = container[key] = [None] * len(value)
+            for index, item in enumerate(value):
+                if type(item) in _SCALAR_TYPES:
+                    out[index] = item
+                else:
+                    stack.append((item, out, index))
+        elif isinstance(value, dict):
+            out = container[key] = dict.fromkeys(value)
+            for k, v in value.items():
+                if type(v) in _SCALAR_TYPES:
+                    out[k] = v
+                else:
+                    stack.append((v, out, k))
+        else:
+            container[key] = value
+    return root[0]
 
 
-def _print_json(data):
-    print(json.dumps(_serialize(data), ensure_ascii=False, indent=2))
+def _dumps_json_bytes(data) -> bytes:
+    # orjson rejects a few values stdlib accepts (e.g. ints wider than 64 bits); fall back
+    # per value for those. The output is equivalent JSON, not always identical to stdlib:
+    # orjson writes NaN/Infinity as null and spells floats differently (1e16 vs 1e+16).
+    try:
+        return orjson.dumps(data, option=_ORJSON_OPTIONS)
+    except TypeError:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _print_json(data, primitive: bool = False):
+    # primitive=True: caller already passes plain containers (e.g. DatClass.to_dict() output,
+    # which converts recursively), so the `_serialize` walk would be a no-op.
+    if not primitive:
+        data = _serialize(data)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and buffer is not None:
+        sys.stdout.flush()
+        buffer.write(_dumps_json_bytes(data) + b"\n")
+        buffer.flush()
+        return
+    print(json.dumps(data, ensure_ascii=False, indent=2))
+
+
+def _print_json_list(items: Iterable):
+    # Same output as `_print_json(list(items), primitive=True)`, but encodes one item at a
+    # time so peak memory stays at a single entry. Newlines only appear between tokens
+    # (string values are escaped), so re-indenting each chunk nests it inside the array.
+    buffer = getattr(sys.stdout, "buffer", None)
+    first = True
+    if orjson is not None and buffer is not None:
+        sys.stdout.flush()
+        buffer.write(b"[")
+        for item in items:
+            buffer.write(b"\n  " if first else b",\n  ")
+            buffer.write(_dumps_json_bytes(item).replace(b"\n", b"\n  "))
+            first = False
+        buffer.write(b"]\n" if first else b"\n]\n")
+        buffer.flush()
+        return
+
+    encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+    write = sys.stdout.write
+    write("[")
+    for item in items:
+        write("\n  " if first else ",\n  ")
+        for chunk in encoder.iterencode(item):
+            write(chunk.replace("\n", "\n  "))
+        first = False
+    write("]\n" if first else "\n]\n")
 
 
 def _cmd_login(args: argparse.Namespace) -> int:
     ali = _build_client(args)
     user = ali.get_user()
     if args.json:
-        _print_json(user.to_dict())
+        _print_json(user.to_dict(), primitive=True)
     else:
         print(f"login ok: {user.nick_name or user.user_name} ({user.user_id})")
     return 0
 
 
 def _cmd_logout(args: argparse.Namespace) -> int:
+    from aligo import logout
+
+    _cached_client.cache_clear()
     try:
         logout(args.profile)
     except FileNotFoundError:
         if args.json:
-            _print_json({"ok": True, "profile": args.profile, "message": "already logged out"})
+            _print_json({"ok": True, "profile": args.profile, "message": "already logged out"}, primitive=True)
         else:
             print(f"already logged out: {args.profile}")
         return 0
     if args.json:
-        _print_json({"ok": True, "profile": args.profile})
+        _print_json({"ok": True, "profile": args.profile}, primitive=True)
     else:
         print(f"logout ok: {args.profile}")
     return 0
@@ -207,7 +550,8 @@ def _cmd_info(args: argparse.Namespace) -> int:
                 "user": user.to_dict(),
                 "personal_info": info.to_dict(),
                 "default_drive_id": ali.default_drive_id,
-            }
+            },
+            primitive=True,
         )
     else:
         print(f"user: {user.nick_name or user.user_name} ({user.user_id})")
@@ -220,14 +564,16 @@ def _cmd_ls(args: argparse.Namespace) -> int:
     target = _resolve_remote_file(ali, args.path, drive_id=args.drive_id)
     files = [target] if target.type != "folder" else ali.get_file_list(parent_file_id=target.file_id, drive_id=args.drive_id)
     if args.json:
-        _print_json([item.to_dict() for item in files])
+        _print_json_list(item.to_dict() for item in files)
         return 0
 
-    for item in files:
-        if args.long:
-            print(f"{item.type:6} {str(item.size or 0):>12} {item.updated_at or '-':24} {item.name}")
-        else:
-            print(item.name)
+    if args.long:
+        row = "{:6} {:>12} {:24} {}".format
+        rows = [row(item.type, str(item.size or 0), item.updated_at or "-", item.name) for item in files]
+    else:
+        rows = [item.name for item in files]
+    if rows:
+        sys.stdout.write("\n".join(rows) + "\n")
     return 0
 
 
@@ -235,7 +581,7 @@ def _cmd_mb(args: argparse.Namespace) -> int:
     ali = _build_client(args)
     folder = _resolve_remote_folder(ali, args.path, drive_id=args.drive_id, create=True)
     if args.json:
-        _print_json(folder.to_dict())
+        _print_json(folder.to_dict(), primitive=True)
     else:
         print(folder.file_id)
     return 0
@@ -244,17 +590,25 @@ def _cmd_mb(args: argparse.Namespace) -> int:
 def _cmd_put(args: argparse.Namespace) -> int:
     ali = _build_client(args)
     local_path = os.path.abspath(args.local_path)
-    if not os.path.exists(local_path):
-        raise FileNotFoundError(local_path)
+    # one stat answers both "exists" (raises FileNotFoundError) and "is it a folder"
+    is_dir = stat.S_ISDIR(os.stat(local_path).st_mode)
     destination = args.remote_path or "/"
-    parent_folder = _resolve_remote_folder(ali, destination, drive_id=args.drive_id, create=True)
+    # only the id is needed, so a warm destination path costs no request
+    parent_file_id = _remote_folder_id(ali, _normalize_remote_path(destination), drive_id=args.drive_id, create=True)
 
-    if os.path.isdir(local_path):
-        result = ali.upload_folder(local_path, parent_file_id=parent_folder.file_id, drive_id=args.drive_id)
+    if is_dir:
+        result = _upload_tree(
+            ali,
+            local_path,
+            parent_file_id,
+            drive_id=args.drive_id,
+            check_name_mode=args.check_name_mode,
+            concurrency=args.concurrency,
+        )
     else:
         result = ali.upload_file(
             local_path,
-            parent_file_id=parent_folder.file_id,
+            parent_file_id=parent_file_id,
             drive_id=args.drive_id,
             check_name_mode=args.check_name_mode,
         )
@@ -269,13 +623,14 @@ def _cmd_get(args: argparse.Namespace) -> int:
     ali = _build_client(args)
     remote = _resolve_remote_file(ali, args.remote_path, drive_id=args.drive_id)
     local_dir = os.path.abspath(args.local_path or ".")
-    os.makedirs(local_dir, exist_ok=True)
     if remote.type == "folder":
-        out = ali.download_folder(remote.file_id, local_folder=local_dir, drive_id=args.drive_id)
+        # `_download_tree` creates local_dir together with the folder it downloads into
+        out = _download_tree(ali, remote, local_dir, drive_id=args.drive_id, concurrency=args.concurrency)
     else:
+        os.makedirs(local_dir, exist_ok=True)
         out = ali.download_file(file=remote, local_folder=local_dir)
     if args.json:
-        _print_json({"output": out})
+        _print_json({"output": out}, primitive=True)
     else:
         print(out)
     return 0
@@ -283,27 +638,49 @@ def _cmd_get(args: argparse.Namespace) -> int:
 
 def _cmd_rm(args: argparse.Namespace) -> int:
     ali = _build_client(args)
-    target = _resolve_remote_file(ali, args.path, drive_id=args.drive_id)
-    result = ali.move_file_to_trash(target.file_id, drive_id=args.drive_id)
+    if len(args.path) == 1:
+        target = _resolve_remote_file(ali, args.path[0], drive_id=args.drive_id)
+        result = ali.move_file_to_trash(target.file_id, drive_id=args.drive_id)
+        _path_cache_forget(args.drive_id, _normalize_remote_path(args.path[0]))
+        if args.json:
+            _print_json(result.to_dict(), primitive=True)
+        else:
+            print(f"moved to trash: {target.name}")
+        return 0
+
+    # Trashing a folder already takes its whole subtree server-side, so the per-request cost
+    # worth removing is one round-trip per target: resolve them concurrently, then trash
+    # them through the batch API (100 per request).
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as executor:
+        targets = list(executor.map(lambda path: _resolve_remote_file(ali, path, drive_id=args.drive_id), args.path))
+    from aligo import Null
+
+    file_ids = list(dict.fromkeys(target.file_id for target in targets))
+    results = ali.batch_move_to_trash(file_ids, drive_id=args.drive_id)
+    for path in args.path:
+        _path_cache_forget(args.drive_id, _normalize_remote_path(path))
+    if len(results) < len(file_ids) or any(isinstance(result, Null) for result in results):
+        raise RuntimeError("batch trash request failed, check recycle bin for partially trashed items")
+    failed = [result.id for result in results if (result.status or 0) >= 400]
     if args.json:
-        _print_json(result.to_dict())
+        _print_json([result.to_dict() for result in results], primitive=True)
     else:
-        print(f"moved to trash: {target.name}")
-    return 0
+        print(f"moved to trash: {len(file_ids) - len(failed)} items" + (f", failed: {len(failed)}" if failed else ""))
+    return 1 if failed else 0
 
 
 def _cmd_cp(args: argparse.Namespace) -> int:
     ali = _build_client(args)
-    src = _resolve_remote_file(ali, args.source, drive_id=args.drive_id)
+    src_file_id = _resolve_source_id(ali, args.source, drive_id=args.drive_id)
     to_parent_file_id, new_name = _resolve_target_parent_and_name(ali, args.destination, drive_id=args.drive_id)
     result = ali.copy_file(
-        src.file_id,
+        src_file_id,
         to_parent_file_id=to_parent_file_id,
         new_name=new_name,
         drive_id=args.drive_id,
     )
     if args.json:
-        _print_json(result.to_dict())
+        _print_json(result.to_dict(), primitive=True)
     else:
         print(result.file_id)
     return 0
@@ -311,16 +688,17 @@ def _cmd_cp(args: argparse.Namespace) -> int:
 
 def _cmd_mv(args: argparse.Namespace) -> int:
     ali = _build_client(args)
-    src = _resolve_remote_file(ali, args.source, drive_id=args.drive_id)
+    src_file_id = _resolve_source_id(ali, args.source, drive_id=args.drive_id)
     to_parent_file_id, new_name = _resolve_target_parent_and_name(ali, args.destination, drive_id=args.drive_id)
     result = ali.move_file(
-        src.file_id,
+        src_file_id,
         to_parent_file_id=to_parent_file_id,
         new_name=new_name,
         drive_id=args.drive_id,
     )
+    _path_cache_forget(args.drive_id, _normalize_remote_path(args.source))
     if args.json:
-        _print_json(result.to_dict())
+        _print_json(result.to_dict(), primitive=True)
     else:
         print(result.file_id)
     return 0
@@ -336,19 +714,66 @@ def _cmd_sync(args: argparse.Namespace) -> int:
     elif args.mode == "remote":
         flag = False
 
-    ali.sync_folder(
-        local_folder=os.path.abspath(args.local_path),
-        remote_folder=remote_folder.file_id,
-        flag=flag,
-        ignore_content=args.ignore_content,
-        follow_delete=args.follow_delete,
-        drive_id=args.drive_id,
-    )
+    try:
+        ali.sync_folder(
+            local_folder=os.path.abspath(args.local_path),
+            remote_folder=remote_folder.file_id,
+            flag=flag,
+            ignore_content=args.ignore_content,
+            follow_delete=args.follow_delete,
+            drive_id=args.drive_id,
+        )
+    finally:
+        # sync may trash or recreate anything below remote_path, even when it fails halfway
+        _path_cache_forget(args.drive_id, _normalize_remote_path(args.remote_path))
     if not args.json:
         print("sync done")
     return 0
 
 
+def _cmd_batch(args: argparse.Namespace) -> int:
+    stream = sys.stdin if args.file == "-" else open(args.file, encoding="utf-8")
+    status = 0
+    try:
+        for lineno, line in enumerate(stream, start=1):
+            try:
+                argv = shlex.split(line, comments=True)
+            except ValueError as exc:
+                print(f"error: line {lineno}: {exc}", file=sys.stderr)
+                status = status or 1
+                continue
+            if not argv:
+                continue
+            if argv[0] == "batch":
+                print(f"error: line {lineno}: nested batch is not supported", file=sys.stderr)
+                status = status or 1
+                continue
+            try:
+                line_args = _parser_for(argv).parse_args(argv)
+            except SystemExit as exc:
+                # argparse already printed usage/error for this line; keep going
+                status = status or (exc.code if isinstance(exc.code, int) else 2)
+                continue
+            code = _run(line_args)
+            if code == 130:
+                return code
+            status = status or code
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    return status
+
+
+class _VersionAction(argparse.Action):
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        from aligo import __version__
+
+        parser.exit(message=f"aligo {__version__}\n")
+
+
 def _add_common_flags(parser: argparse.ArgumentParser):
     parser.add_argument("--profile", default="aligo", help="config profile name")
     parser.add_argument("--drive-id", default=None, help="target drive id")
@@ -358,20 +783,11 @@ def _add_common_flags(parser: argparse.ArgumentParser):
     parser.add_argument("--no-relogin", action="store_true", help="disable relogin when token expired")
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(prog="aligo", description="Aliyun Drive CLI (s3cmd-like)")
-    parser.add_argument("-v", "--version", action="version", version=f"aligo {__version__}")
-
-    sub = parser.add_subparsers(dest="command")
-    try:
-        sub.required = True  # Python >= 3.7
-    except AttributeError:
-        pass
-
+def _add_login_parser(sub):
     p_login = sub.add_parser("login", help="login and persist token")
     _add_common_flags(p_login)
     p_login.add_argument("--port", type=int, default=None, help="web login port")
-    p_login.add_argument("--email-to", default=None, help="send login qrcode to email")
+    p_login.add_argument("--email-to", default=None, help="send login qrcode to email(s), comma separated")
     p_login.add_argument("--email-user", default=None, help="smtp user")
     p_login.add_argument("--email-password", default=None, help="smtp password")
     p_login.add_argument("--email-host", default=None, help="smtp host")
@@ -379,25 +795,35 @@ def build_parser() -> argparse.ArgumentParser:
     p_login.add_argument("--email-content", default="", help="email extra content")
     p_login.set_defaults(func=_cmd_login)
 
+
+def _add_logout_parser(sub):
     p_logout = sub.add_parser("logout", help="logout and remove local token")
     _add_common_flags(p_logout)
     p_logout.set_defaults(func=_cmd_logout)
 
+
+def _add_info_parser(sub):
     p_info = sub.add_parser("info", help="show account information")
     _add_common_flags(p_info)
     p_info.set_defaults(func=_cmd_info)
 
+
+def _add_ls_parser(sub):
     p_ls = sub.add_parser("ls", help="list remote files")
     _add_common_flags(p_ls)
     p_ls.add_argument("path", nargs="?", default="/", help="remote path, e.g. /Movies")
     p_ls.add_argument("-l", "--long", action="store_true", help="long listing")
     p_ls.set_defaults(func=_cmd_ls)
 
+
+def _add_mb_parser(sub):
     p_mb = sub.add_parser("mb", help="make remote folder path")
     _add_common_flags(p_mb)
     p_mb.add_argument("path", help="remote folder path")
     p_mb.set_defaults(func=_cmd_mb)
 
+
+def _add_put_parser(sub):
     p_put = sub.add_parser("put", help="upload local file/folder")
     _add_common_flags(p_put)
     p_put.add_argument("local_path", help="local path to upload")
@@ -408,31 +834,44 @@ def build_parser() -> argparse.ArgumentParser:
         choices=["auto_rename", "refuse", "overwrite"],
         help="name conflict strategy",
     )
+    p_put.add_argument("--concurrency", type=int, default=8, help="parallel uploads for folder")
     p_put.set_defaults(func=_cmd_put)
 
+
+def _add_get_parser(sub):
     p_get = sub.add_parser("get", help="download remote file/folder")
     _add_common_flags(p_get)
     p_get.add_argument("remote_path", help="remote path to download")
     p_get.add_argument("local_path", nargs="?", default=".", help="local destination folder")
+    p_get.add_argument("--concurrency", type=int, default=8, help="parallel downloads for folder")
     p_get.set_defaults(func=_cmd_get)
 
+
+def _add_rm_parser(sub):
     p_rm = sub.add_parser("rm", help="move remote file/folder to trash")
     _add_common_flags(p_rm)
-    p_rm.add_argument("path", help="remote path")
+    p_rm.add_argument("path", nargs="+", help="remote path(s)")
+    p_rm.add_argument("--concurrency", type=int, default=8, help="parallel path lookups for multiple paths")
     p_rm.set_defaults(func=_cmd_rm)
 
+
+def _add_cp_parser(sub):
     p_cp = sub.add_parser("cp", help="copy remote file/folder")
     _add_common_flags(p_cp)
     p_cp.add_argument("source", help="source remote path")
     p_cp.add_argument("destination", help="destination remote path or folder")
     p_cp.set_defaults(func=_cmd_cp)
 
+
+def _add_mv_parser(sub):
     p_mv = sub.add_parser("mv", help="move remote file/folder")
     _add_common_flags(p_mv)
     p_mv.add_argument("source", help="source remote path")
     p_mv.add_argument("destination", help="destination remote path or folder")
     p_mv.set_defaults(func=_cmd_mv)
 
+
+def _add_sync_parser(sub):
     p_sync = sub.add_parser("sync", help="sync local folder with remote folder")
     _add_common_flags(p_sync)
     p_sync.add_argument("local_path", help="local folder path")
@@ -447,15 +886,56 @@ def build_parser() -> argparse.ArgumentParser:
     p_sync.add_argument("--follow-delete", action="store_true", help="follow delete operations")
     p_sync.set_defaults(func=_cmd_sync)
 
+
+def _add_batch_parser(sub):
+    p_batch = sub.add_parser("batch", help="run newline-delimited commands with one shared client")
+    p_batch.add_argument("file", nargs="?", default="-", help="command file, '-' for stdin")
+    p_batch.set_defaults(func=_cmd_batch)
+
+
+# Subcommand name -> factory, in `--help` order. `main` only builds the one being invoked.
+_SUBCMDS = {
+    "login": _add_login_parser,
+    "logout": _add_logout_parser,
+    "info": _add_info_parser,
+    "ls": _add_ls_parser,
+    "mb": _add_mb_parser,
+    "put": _add_put_parser,
+    "get": _add_get_parser,
+    "rm": _add_rm_parser,
+    "cp": _add_cp_parser,
+    "mv": _add_mv_parser,
+    "sync": _add_sync_parser,
+    "batch": _add_batch_parser,
+}
+
+
+def build_parser(commands: Optional[Iterable[str]] = None) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="aligo", description="Aliyun Drive CLI (s3cmd-like)")
+    parser.add_argument("-v", "--version", action=_VersionAction, help="show program's version number and exit")
+
+    # Explicit metavar keeps usage/error output listing every command even for a narrow parser.
+    sub = parser.add_subparsers(dest="command", metavar="{" + ",".join(_SUBCMDS) + "}")
+    try:
+        sub.required = True  # Python >= 3.7
+    except AttributeError:
+        pass
+
+    for name, add_parser in _SUBCMDS.items():
+        if commands is None or name in commands:
+            add_parser(sub)
     return parser
 
 
-def main(argv=None) -> int:
-    parser = build_parser()
-    args = parser.parse_args(argv)
-    if not hasattr(args, "func"):
-        parser.print_help()
-        return 2
+def _parser_for(argv: List[str]) -> argparse.ArgumentParser:
+    # A known subcommand in first position only needs its own subparser; anything else
+    # (no args, --help, --version, typos) gets the full parser for complete usage output.
+    if argv and argv[0] in _SUBCMDS:
+        return build_parser([argv[0]])
+    return build_parser()
+
+
+def _run(args: argparse.Namespace) -> int:
     try:
         return args.func(args)
     except KeyboardInterrupt:
@@ -468,5 +948,15 @@ def main(argv=None) -> int:
         return 1
 
 
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    parser = _parser_for(argv)
+    args = parser.parse_args(argv)
+    if not hasattr(args, "func"):
+        parser.print_help()
+        return 2
+    return _run(args)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
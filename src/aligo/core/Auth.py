@@ -4,8 +4,10 @@ import base64
 import json
 import logging
 import os
+import re
 import sys
 import tempfile
+import threading
 import time
 import uuid
 from http.server import HTTPServer
@@ -22,7 +24,7 @@ from aligo.error import AligoStatus500, AligoRefreshFailed, AligoFatalError, Ali
 from aligo.types import *
 from aligo.types.Enum import *
 from aligo.utils.LoginTimout import LoginTimeout
-from .EMail import send_email
+from .EMail import send_emails
 from .LoginServer import LoginServer
 
 # 默认配置目录
@@ -186,6 +188,9 @@ class Auth:
         self.session.headers.update(UNI_HEADERS)
 
         self.token: Optional[Token] = None
+        # 多线程共用同一实例时, 保证同一时刻只有一个线程刷新 token 或登录
+        # 可重入: _refresh_token -> _login -> _refresh_token
+        self._token_lock = threading.RLock()
         if os.name == 'nt':
             self._os_name = 'Windows 操作系统'
             show = show or self._show_qrcode_in_window
@@ -420,7 +425,11 @@ class Auth:
                 elif b'"UserDeviceOffline"' in response.content:
                     self._create_session()
                 else:
-                    self._refresh_token()
+                    stale = response.request.headers.get('Authorization')
+                    with self._token_lock:
+                        # 等锁期间其他线程可能已刷新, token 已变化则直接重试
+                        if self.session.headers.get('Authorization') == stale:
+                            self._refresh_token()
                 continue
 
             if status_code in [429, 502, 504]:
@@ -549,12 +558,20 @@ class Auth:
         qr_img_path = tempfile.mktemp()
         qr_img.save(qr_img_path)
         qr_data = open(qr_img_path, 'rb').read()
-        send_email(
-            self._email.email, self._name_name, self._email.content, qr_data,
-            self._email.user, self._email.password, self._email.host, self._email.port
-        )
-        os.remove(qr_img_path)
-        self.log.info(f'登录二维码已发送至 {self._email.email}')
+        # 支持多个收件人, 以 ',' 或 ';' 分隔
+        receivers = [i.strip() for i in re.split(r'[,;]', self._email.email) if i.strip()]
+        try:
+            results = send_emails(
+                receivers, self._name_name, self._email.content, qr_data,
+                self._email.user, self._email.password, self._email.host, self._email.port
+            )
+        finally:
+            os.remove(qr_img_path)
+        failed = [receiver for receiver, refused in results.items() if refused]
+        if failed:
+            self.log.warning(f'以下收件人发送失败 {failed}')
+        sent = [receiver for receiver, refused in results.items() if not refused]
+        self.log.info(f'登录二维码已发送至 {", ".join(sent)}')
 
     def _log_response(self, response: requests.Response):
         """打印响应日志"""
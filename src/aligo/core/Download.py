@@ -14,7 +14,8 @@ from aligo.types import BaseFile
 
 class Download(BaseAligo):
     """..."""
-    _DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
+    _DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB, 同时用作写文件缓冲区大小
+    _DOWNLOAD_PROGRESS = True  # 是否显示单个文件的下载进度条, 多线程并发下载时关闭以免进度条交错
 
     def _core_get_download_url(self, body: GetDownloadUrlRequest) -> GetDownloadUrlResponse:
         """..."""
@@ -94,16 +95,16 @@ class Download(BaseAligo):
                 total_size = int(resp.headers.get('content-length', 0))
                 accept_range = resp.headers.get('Accept-Ranges', None)
                 if accept_range == 'bytes':
-                    progress_bar = tqdm(total=total_size + tmp_size, unit='B', unit_scale=True, colour='#31a8ff')
+                    progress_bar = tqdm(total=total_size + tmp_size, unit='B', unit_scale=True, colour='#31a8ff', disable=not self._DOWNLOAD_PROGRESS)
                     progress_bar.update(tmp_size)
-                    with open(tmp_file, 'ab') as f:
+                    with open(tmp_file, 'ab', buffering=Download._DOWNLOAD_CHUNK_SIZE) as f:
                         for content in resp.iter_content(chunk_size=Download._DOWNLOAD_CHUNK_SIZE):
                             progress_bar.update(len(content))
                             f.write(content)
                 else:
                     self._auth.log.warning(f'不支持断点续传 {file_path}')
-                    progress_bar = tqdm(total=total_size, unit='B', unit_scale=True, colour='#31a8ff')
-                    with open(tmp_file, 'wb') as f:
+                    progress_bar = tqdm(total=total_size, unit='B', unit_scale=True, colour='#31a8ff', disable=not self._DOWNLOAD_PROGRESS)
+                    with open(tmp_file, 'wb', buffering=Download._DOWNLOAD_CHUNK_SIZE) as f:
                         for content in resp.iter_content(chunk_size=Download._DOWNLOAD_CHUNK_SIZE):
                             progress_bar.update(len(content))
                             f.write(content)
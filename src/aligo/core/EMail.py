@@ -1,4 +1,5 @@
 """发送邮件模块"""
+import functools
 import smtplib
 import ssl
 import time
@@ -7,6 +8,7 @@ from email.mime.image import MIMEImage
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.utils import formataddr, parseaddr
+from typing import Dict, List
 
 
 def _format_mailbox(value: str, fallback_name: str = '') -> str:
@@ -26,14 +28,25 @@ def _format_mailbox(value: str, fallback_name: str = '') -> str:
     return formataddr((name, address))
 
 
-def send_email(
-        receiver: str, title: str, content: str, qr_data: bytes,
-        email_user: str, email_password: str, email_host: str, email_port: int,
-):
-    """发送邮件"""
+def _smtp_login(email_user: str, email_password: str, email_host: str, email_port: int) -> smtplib.SMTP:
+    """连接并登录 SMTP 服务器"""
+    try:
+        smtp = smtplib.SMTP_SSL(email_host, email_port)
+    except ssl.SSLError:
+        smtp = smtplib.SMTP(email_host, email_port)
+    smtp.login(email_user, email_password)
+    return smtp
+
+
+@functools.lru_cache(maxsize=4)
+def build_payload(title: str, content: str, qr_data: bytes, email_user: str) -> bytes:
+    """构造并序列化邮件 (不含 To 头), 结果按参数缓存
+
+    同一二维码发给多个收件人时只做一次 MIME/base64 编码. 以 qr_data 内容而非 id() 作为缓存键,
+    避免对象回收后 id 被复用而发出旧二维码.
+    """
     msg_root = MIMEMultipart()
     msg_root['From'] = _format_mailbox(email_user, fallback_name='aligo notify')
-    msg_root['To'] = _format_mailbox(receiver)
     msg_root['Subject'] = f'[阿里云盘/{title}] 扫码登录'
 
     msg_root.attach(
@@ -43,20 +56,70 @@ def send_email(
     msg_image.add_header('Content-ID', '<qrcode>')
 
     msg_root.attach(msg_image)
+    return msg_root.as_bytes()
+
+
+def _address_payload(payload: bytes, receiver: str) -> bytes:
+    """为缓存的邮件加上收件人 To 头"""
+    return f'To: {_format_mailbox(receiver)}\n'.encode('ascii') + payload
 
+
+def send_emails(
+        receivers: List[str], title: str, content: str, qr_data: bytes,
+        email_user: str, email_password: str, email_host: str, email_port: int,
+) -> Dict[str, dict]:
+    """发送邮件给多个收件人, 所有收件人共用同一个 SMTP 连接 (只连接、登录一次)
+
+    返回 {收件人: 被拒绝的收件人字典}, 与 smtplib.SMTP.sendmail 的返回值格式相同, 空字典表示发送成功.
+    单个收件人被服务器拒绝, 或重试 3 次后连接仍断开 (记为 (-1, 错误信息)) 时, 记录后继续发送其余收件人,
+    仅当全部收件人都失败时抛出 RuntimeError.
+    """
+    # 只序列化一次, 所有收件人及重试时复用
+    payload = build_payload(title, content, qr_data, email_user)
+    payloads = [(receiver, _address_payload(payload, receiver)) for receiver in receivers]
+    results = {}
+    retries = 3
+    smtp = _smtp_login(email_user, email_password, email_host, email_port)
     try:
-        smtp = smtplib.SMTP_SSL(email_host, email_port)
-    except ssl.SSLError:
-        smtp = smtplib.SMTP(email_host, email_port)
-    smtp.login(email_user, email_password)
-    for i in range(1, 4):
+        for receiver, payload in payloads:
+            for i in range(1, retries + 1):
+                try:
+                    results[receiver] = smtp.sendmail(email_user, [receiver], payload)
+                    break
+                except smtplib.SMTPRecipientsRefused as e:
+                    # 地址被拒绝, 重试无意义, 记录后发送下一个收件人
+                    results[receiver] = e.recipients
+                    break
+                except smtplib.SMTPResponseException as e:
+                    results[receiver] = {receiver: (e.smtp_code, e.smtp_error)}
+                    break
+                except smtplib.SMTPServerDisconnected as e:
+                    if i == retries:
+                        # 重试次数用完, 记录失败; 仍重新连接, 供下一个收件人使用
+                        results[receiver] = {receiver: (-1, str(e).encode())}
+                    else:
+                        time.sleep(min(30, 2 ** i))
+                # 连接已断开, 重新连接并登录; 失败则留给下一轮重试
+                smtp.close()
+                try:
+                    smtp = _smtp_login(email_user, email_password, email_host, email_port)
+                except (OSError, smtplib.SMTPException):
+                    pass
+    finally:
         try:
-            result = smtp.sendmail(
-                email_user,
-                [receiver],
-                msg_root.as_bytes()
-            )
-            return result
-        except smtplib.SMTPServerDisconnected:
-            time.sleep(i * 3)
-    raise RuntimeError(f'邮件发送失败 {receiver}')
+            smtp.quit()
+        except (OSError, smtplib.SMTPException):
+            smtp.close()
+    if results and all(results.values()):
+        raise RuntimeError(f'邮件发送失败 {results}')
+    return results
+
+
+def send_email(
+        receiver: str, title: str, content: str, qr_data: bytes,
+        email_user: str, email_password: str, email_host: str, email_port: int,
+):
+    """发送邮件"""
+    return send_emails(
+        [receiver], title, content, qr_data, email_user, email_password, email_host, email_port
+    )[receiver]
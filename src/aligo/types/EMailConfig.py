@@ -7,7 +7,7 @@ from .Type import DatClass
 @dataclass
 class EMailConfig(DatClass):
     """邮箱配置"""
-    email: str  # 接收邮件的邮箱
+    email: str  # 接收邮件的邮箱, 多个以 ',' 分隔
     host: str  # 示例值 'smtp.163.com'
     port: int  # 示例值 465
     user: str  # 示例值 'aligo_notify@163.com'
@@ -0,0 +1,67 @@
+import logging
+import threading
+import unittest
+from unittest import mock
+
+from aligo.core.Auth import Auth
+
+
+class FakeResponse:
+    def __init__(self, status_code, authorization):
+        self.status_code = status_code
+        self.content = b'{"code":"AccessTokenInvalid"}' if status_code == 401 else b'{}'
+        self.request = mock.Mock(headers={'Authorization': authorization})
+
+
+class FakeSession:
+    """Answers 401 to the stale token; the first caller waits until every thread got its 401."""
+
+    def __init__(self, threads):
+        self.headers = {'Authorization': 'old'}
+        self._barrier = threading.Barrier(threads)
+
+    def request(self, **kwargs):
+        authorization = self.headers['Authorization']
+        if authorization == 'old':
+            self._barrier.wait(timeout=5)
+            return FakeResponse(401, authorization)
+        return FakeResponse(200, authorization)
+
+
+class TokenRefreshTests(unittest.TestCase):
+    def make_auth(self, threads):
+        auth = Auth.__new__(Auth)
+        auth.log = logging.getLogger('aligo.test')
+        auth.session = FakeSession(threads)
+        auth._token_lock = threading.RLock()
+        auth._request_interval = 0
+        auth._requests_timeout = 1
+        auth._log_response = lambda response: None
+        auth.refreshes = []
+
+        def refresh_token():
+            auth.refreshes.append(threading.current_thread().name)
+            auth.session.headers['Authorization'] = 'new'
+
+        auth._refresh_token = refresh_token
+        return auth
+
+    def test_concurrent_401s_refresh_once(self):
+        auth = self.make_auth(threads=4)
+        statuses = []
+
+        def worker():
+            statuses.append(auth.request('GET', 'https://example.com').status_code)
+
+        workers = [threading.Thread(target=worker) for _ in range(4)]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+
+        self.assertEqual(len(auth.refreshes), 1)
+        self.assertEqual(statuses, [200] * 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import argparse
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+from aligo import cli
+
+
+def _client_args(**overrides):
+    values = dict(debug=False, profile="aligo", refresh_token=None, no_relogin=False, drive_id=None)
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+class BuildClientCacheTests(unittest.TestCase):
+    def setUp(self):
+        cli._cached_client.cache_clear()
+        self.addCleanup(cli._cached_client.cache_clear)
+
+    def test_reuses_client_for_same_login_setup(self):
+        with mock.patch("aligo.Aligo") as aligo_cls:
+            first = cli._build_client(_client_args())
+            second = cli._build_client(_client_args())
+            cli._build_client(_client_args(profile="work"))
+
+        self.assertIs(first, second)
+        self.assertEqual(aligo_cls.call_count, 2)
+        self.assertEqual(aligo_cls.call_args_list[1].kwargs["name"], "work")
+
+    def test_stamps_default_drive_id(self):
+        defaulted, explicit = _client_args(), _client_args(drive_id="drive-2")
+        with mock.patch("aligo.Aligo") as aligo_cls:
+            aligo_cls.return_value.default_drive_id = "drive-1"
+            cli._build_client(defaulted)
+            cli._build_client(explicit)
+
+        self.assertEqual(defaulted.drive_id, "drive-1")
+        self.assertEqual(explicit.drive_id, "drive-2")
+
+
+class ParserDispatchTests(unittest.TestCase):
+    def test_narrow_parser_matches_full_parser(self):
+        for argv in (["ls", "/a", "-l", "--json"], ["put", "./x", "/b", "--concurrency", "4"], ["rm", "/a", "/b"]):
+            narrow = cli._parser_for(argv).parse_args(argv)
+            full = cli.build_parser().parse_args(argv)
+            self.assertEqual(vars(narrow), vars(full))
+
+    def test_only_invoked_subcommand_is_built(self):
+        sub = next(a for a in cli._parser_for(["ls"])._actions if isinstance(a, argparse._SubParsersAction))
+        self.assertEqual(list(sub.choices), ["ls"])
+
+    def test_unknown_command_uses_full_parser(self):
+        err = io.StringIO()
+        with redirect_stderr(err), self.assertRaises(SystemExit):
+            cli.main(["lss"])
+        self.assertIn("'ls'", err.getvalue())
+
+
+class LazyImportTests(unittest.TestCase):
+    def test_console_entry_point_does_not_load_sdk(self):
+        # `aligo` console script imports the package first, then aligo.cli
+        src_dir = os.path.dirname(os.path.dirname(os.path.abspath(cli.__file__)))
+        code = "import sys, aligo.cli; aligo.cli.build_parser(); print('requests' in sys.modules)"
+        out = subprocess.run([sys.executable, "-c", code], env=dict(os.environ, PYTHONPATH=src_dir),
+                             stdout=subprocess.PIPE, check=True).stdout
+        self.assertEqual(out.strip(), b"False")
+
+    def test_package_names_load_on_first_access(self):
+        import aligo
+
+        self.assertIs(aligo.Aligo, aligo.apis.Aligo)
+        self.assertIn("Aligo", aligo.__all__)
+
+
+class FakeItem:
+    def __init__(self, name):
+        self.name = name
+        self.type = "file"
+
+
+class BatchCommandTests(unittest.TestCase):
+    def run_batch(self, text):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "commands.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            out, err = io.StringIO(), io.StringIO()
+            resolved = []
+
+            def resolve(ali, remote_path, drive_id=None):
+                resolved.append(remote_path)
+                return FakeItem(os.path.basename(remote_path))
+
+            with mock.patch.object(cli, "_build_client", return_value=object()), \
+                    mock.patch.object(cli, "_resolve_remote_file", side_effect=resolve), \
+                    redirect_stdout(out), redirect_stderr(err):
+                code = cli.main(["batch", path])
+        return code, out.getvalue(), err.getvalue(), resolved
+
+    def test_runs_each_line_and_skips_comments(self):
+        code, out, _, resolved = self.run_batch("# listing\nls '/a b.txt'\n\nls /c.txt  # trailing\n")
+
+        self.assertEqual(code, 0)
+        self.assertEqual(resolved, ["/a b.txt", "/c.txt"])
+        self.assertEqual(out, "a b.txt\nc.txt\n")
+
+    def test_keeps_going_after_bad_line(self):
+        code, out, err, resolved = self.run_batch("ls --nope\nbatch other.txt\nls /c.txt\n")
+
+        self.assertEqual(code, 2)
+        self.assertEqual(resolved, ["/c.txt"])
+        self.assertIn("nested batch", err)
+
+    def test_unbalanced_quote_skips_only_that_line(self):
+        code, out, err, resolved = self.run_batch("ls 'unterminated\nls /c.txt\n")
+
+        self.assertEqual(code, 1)
+        self.assertEqual(resolved, ["/c.txt"])
+        self.assertIn("error: line 1: No closing quotation", err)
+
+
+if __name__ == "__main__":
+    unittest.main()
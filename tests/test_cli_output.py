@@ -0,0 +1,140 @@
+import argparse
+import io
+import json
+import sys
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from aligo import cli
+from aligo.cli import _print_json, _print_json_list, _serialize
+
+
+class FakeItem:
+    def __init__(self, name, size):
+        self.name = name
+        self.size = size
+
+    def to_dict(self):
+        return {"name": self.name, "size": self.size, "tags": ["a\nb", "云盘"], "meta": {"x": None}}
+
+
+ITEMS = [FakeItem("one", 1), FakeItem("二", 2)]
+
+
+def _capture_binary_stdout(func, *args):
+    raw = io.BytesIO()
+    out = io.TextIOWrapper(raw, encoding="utf-8")
+    original, sys.stdout = sys.stdout, out
+    try:
+        func(*args)
+    finally:
+        sys.stdout = original
+    return raw.getvalue().decode("utf-8")
+
+
+class PrintJsonTests(unittest.TestCase):
+    @unittest.skipIf(cli.orjson is None, "orjson not installed")
+    def test_orjson_output_matches_stdlib(self):
+        for data in ({"name": "云盘", "n": 1, "nested": {"k": [1.5, None, True]}, 3: "int key"}, {"big": 2 ** 70}):
+            expected = json.dumps(data, ensure_ascii=False, indent=2) + "\n"
+            self.assertEqual(_capture_binary_stdout(_print_json, data), expected)
+
+    @unittest.skipIf(cli.orjson is None, "orjson not installed")
+    def test_orjson_writes_non_finite_floats_as_null(self):
+        out = _capture_binary_stdout(_print_json, {"nan": float("nan"), "inf": float("inf")})
+
+        self.assertEqual(json.loads(out), {"nan": None, "inf": None})
+
+
+class PrintJsonListTests(unittest.TestCase):
+    def expected(self, items):
+        return json.dumps([item.to_dict() for item in items], ensure_ascii=False, indent=2) + "\n"
+
+    def test_text_stream_matches_json_dumps(self):
+        for items in (ITEMS, []):
+            out = io.StringIO()
+            with redirect_stdout(out):
+                _print_json_list(item.to_dict() for item in items)
+            self.assertEqual(out.getvalue(), self.expected(items))
+
+    @unittest.skipIf(cli.orjson is None, "orjson not installed")
+    def test_binary_stream_matches_json_dumps(self):
+        for items in (ITEMS, []):
+            out = _capture_binary_stdout(_print_json_list, (item.to_dict() for item in items))
+            self.assertEqual(out, self.expected(items))
+
+
+class Wrapper:
+    def __init__(self, inner):
+        self.inner = inner
+
+    def to_dict(self):
+        return {"inner": self.inner}
+
+
+class SerializeTests(unittest.TestCase):
+    def test_converts_nested_to_dict_objects_in_order(self):
+        data = {"b": [1, Wrapper(FakeItem("x", 3)), (1, 2)], "a": Wrapper([None, "s"]), "c": 1.5}
+
+        result = _serialize(data)
+
+        self.assertEqual(
+            result,
+            {"b": [1, {"inner": FakeItem("x", 3).to_dict()}, (1, 2)], "a": {"inner": [None, "s"]}, "c": 1.5},
+        )
+        self.assertEqual(list(result), ["b", "a", "c"])
+
+    def test_handles_nesting_deeper_than_recursion_limit(self):
+        data = leaf = []
+        for _ in range(sys.getrecursionlimit() + 100):
+            child = []
+            leaf.append(child)
+            leaf = child
+
+        result = _serialize(data)
+
+        depth = 0
+        while result:
+            result = result[0]
+            depth += 1
+        self.assertEqual(depth, sys.getrecursionlimit() + 100)
+
+
+class ListedFile:
+    def __init__(self, name, file_type="file", size=None, updated_at=None):
+        self.file_id = name
+        self.name = name
+        self.type = file_type
+        self.size = size
+        self.updated_at = updated_at
+
+
+class ListOutputTests(unittest.TestCase):
+    def run_ls(self, children, long=False):
+        ali = mock.Mock()
+        ali.get_file_list.return_value = children
+        args = argparse.Namespace(path="/", drive_id=None, json=False, long=long)
+        out = io.StringIO()
+        with mock.patch.object(cli, "_build_client", return_value=ali), \
+                mock.patch.object(cli, "_resolve_remote_file", return_value=ListedFile("root", "folder")), \
+                redirect_stdout(out):
+            cli._cmd_ls(args)
+        return out.getvalue()
+
+    def test_long_listing_columns(self):
+        out = self.run_ls([ListedFile("a.txt", size=42, updated_at="2023-01-01T00:00:00Z"), ListedFile("docs", "folder")],
+                          long=True)
+
+        self.assertEqual(
+            out,
+            "file             42 2023-01-01T00:00:00Z     a.txt\n"
+            "folder            0 -                        docs\n",
+        )
+
+    def test_empty_folder_prints_nothing(self):
+        self.assertEqual(self.run_ls([]), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+import unittest
+
+from aligo import cli
+from aligo.cli import (
+    _normalize_remote_path,
+    _path_cache_forget,
+    _resolve_path_to_ids,
+    _resolve_remote_file,
+    _resolve_remote_folder,
+    _resolve_source_id,
+    _resolve_target_parent_and_name,
+)
+
+
+class FakeFile:
+    def __init__(self, file_id, name, file_type="folder"):
+        self.file_id = file_id
+        self.name = name
+        self.type = file_type
+
+
+class FakeAli:
+    def __init__(self):
+        self.children = {"root": []}
+        self.items = {"root": FakeFile("root", "/")}
+        self.list_calls = []
+        self.get_calls = []
+        self.created = []
+
+    def add(self, parent_file_id, file_id, name, file_type="folder"):
+        item = FakeFile(file_id, name, file_type)
+        self.children.setdefault(parent_file_id, []).append(item)
+        self.children.setdefault(file_id, [])
+        self.items[file_id] = item
+        return item
+
+    def get_file(self, file_id, drive_id=None):
+        self.get_calls.append(file_id)
+        return self.items[file_id]
+
+    def create_folder(self, name, parent_file_id="root", drive_id=None, check_name_mode="auto_rename"):
+        self.created.append((parent_file_id, name))
+        folder = self.add(parent_file_id, f"new-{name}", name)
+        folder.file_name = name
+        return folder
+
+    def get_file_list(self, parent_file_id="root", drive_id=None, type=None):
+        self.list_calls.append((parent_file_id, type))
+        return [item for item in self.children.get(parent_file_id, []) if type is None or item.type == type]
+
+
+class NormalizeRemotePathTests(unittest.TestCase):
+    def test_prefixes_relative_paths(self):
+        self.assertEqual(_normalize_remote_path(" tasks/a "), "/tasks/a")
+        self.assertEqual(_normalize_remote_path(""), "/")
+
+    def test_rejects_urls_and_drive_prefixes(self):
+        for value in ("s3://bucket/key", "ali:tasks"):
+            with self.assertRaises(ValueError):
+                _normalize_remote_path(value)
+
+
+class PathCacheTests(unittest.TestCase):
+    def setUp(self):
+        cli._PATH_CACHE.clear()
+        self.ali = FakeAli()
+        self.ali.add("root", "a", "a")
+        self.ali.add("a", "b", "b")
+        self.ali.add("b", "c", "c")
+        self.ali.add("b", "d", "d")
+        self.ali.add("c", "f", "notes.txt", file_type="file")
+
+    def test_caches_ancestors_of_resolved_folder(self):
+        folder = _resolve_remote_folder(self.ali, "/a/b/c")
+
+        self.assertEqual(folder.file_id, "c")
+        self.assertEqual(cli._PATH_CACHE[(None, "/a")], ("a", "folder"))
+        self.assertEqual(cli._PATH_CACHE[(None, "/a/b")], ("b", "folder"))
+
+        self.ali.list_calls.clear()
+        sibling = _resolve_remote_folder(self.ali, "/a/b/d")
+        self.assertEqual(sibling.file_id, "d")
+        self.assertEqual(self.ali.list_calls, [("b", "folder")])
+
+    def test_file_lookup_reuses_cached_parent(self):
+        _resolve_remote_folder(self.ali, "/a/b/c")
+        self.ali.list_calls.clear()
+
+        item = _resolve_remote_file(self.ali, "/a/b/c/notes.txt")
+
+        self.assertEqual(item.file_id, "f")
+        self.assertEqual(self.ali.list_calls, [("c", "file")])
+
+    def test_forget_drops_descendants(self):
+        _resolve_remote_folder(self.ali, "/a/b/c")
+
+        _path_cache_forget(None, "/a/b")
+
+        self.assertEqual(list(cli._PATH_CACHE), [(None, "/a")])
+
+    def test_path_spellings_share_one_key(self):
+        _resolve_remote_folder(self.ali, "/a/b")
+        _resolve_path_to_ids(self.ali, "/a/b/")
+        _resolve_remote_file(self.ali, "/a//b")
+
+        self.assertEqual(list(cli._PATH_CACHE), [(None, "/a"), (None, "/a/b")])
+
+        _path_cache_forget(None, "/a/b/")
+
+        self.assertEqual(list(cli._PATH_CACHE), [(None, "/a")])
+
+    def test_missing_folder_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            _resolve_remote_folder(self.ali, "/a/missing")
+
+    def test_evicts_least_recently_used(self):
+        original = cli._PATH_CACHE_MAXSIZE
+        cli._PATH_CACHE_MAXSIZE = 2
+        try:
+            _resolve_remote_folder(self.ali, "/a/b/c")
+        finally:
+            cli._PATH_CACHE_MAXSIZE = original
+
+        self.assertEqual(list(cli._PATH_CACHE), [(None, "/a/b"), (None, "/a/b/c")])
+
+
+class CopyMoveResolutionTests(unittest.TestCase):
+    def setUp(self):
+        cli._PATH_CACHE.clear()
+        self.ali = FakeAli()
+        self.ali.add("root", "a", "a")
+        self.ali.add("a", "b", "b")
+        self.ali.add("b", "f", "notes.txt", file_type="file")
+
+    def test_path_to_ids_reports_parent_and_leaf(self):
+        self.assertEqual(_resolve_path_to_ids(self.ali, "/a/b/notes.txt"), ("b", "notes.txt", "f"))
+        self.assertEqual(_resolve_path_to_ids(self.ali, "/a/b/missing"), ("b", "missing", None))
+        self.assertEqual(_resolve_path_to_ids(self.ali, "/a/x/missing"), (None, "missing", None))
+
+    def test_source_and_destination_share_walk_without_get_file(self):
+        self.assertEqual(_resolve_source_id(self.ali, "/a/b/notes.txt"), "f")
+        self.ali.list_calls.clear()
+
+        self.assertEqual(_resolve_target_parent_and_name(self.ali, "/a/b/copy.txt"), ("b", "copy.txt"))
+        self.assertEqual(self.ali.list_calls, [("b", "folder")])
+        self.assertEqual(self.ali.get_calls, [])
+        self.assertEqual(self.ali.created, [])
+
+    def test_destination_folder_receives_item(self):
+        self.assertEqual(_resolve_target_parent_and_name(self.ali, "/a/b"), ("b", None))
+
+    def test_creates_only_missing_destination_parents(self):
+        parent_id, name = _resolve_target_parent_and_name(self.ali, "/a/new/copy.txt")
+
+        self.assertEqual((parent_id, name), ("new-new", "copy.txt"))
+        self.assertEqual(self.ali.created, [("a", "new")])
+
+    def test_missing_source_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            _resolve_source_id(self.ali, "/a/b/missing.txt")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,10 @@
+import argparse
+import io
 import unittest
+from contextlib import redirect_stdout
+from unittest import mock
 
+from aligo import cli
 from aligo.cli import _resolve_sync_remote_folder
 
 
@@ -103,5 +108,26 @@ class SyncResolverTests(unittest.TestCase):
         self.assertIn("vocabulary(2)", message)
 
 
+
+class SyncCommandTests(unittest.TestCase):
+    def setUp(self):
+        cli._PATH_CACHE.clear()
+
+    def test_forgets_cached_paths_below_synced_folder(self):
+        ali = FakeAli()
+        tasks = ali.add_folder("root", "tasks")
+        ali.sync_folder = mock.Mock()
+        cli._path_cache_put(None, "/tasks/sub", "trashed-id", "folder")
+        cli._path_cache_put(None, "/other", "other-id", "folder")
+        args = argparse.Namespace(local_path=".", remote_path="tasks", mode="both", ignore_content=False,
+                                  follow_delete=True, drive_id=None, json=False)
+
+        with mock.patch.object(cli, "_build_client", return_value=ali), redirect_stdout(io.StringIO()):
+            cli._cmd_sync(args)
+
+        self.assertEqual(ali.sync_folder.call_args.kwargs["remote_folder"], tasks.file_id)
+        self.assertEqual(list(cli._PATH_CACHE), [(None, "/other")])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,287 @@
+import argparse
+import io
+import os
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+from aligo import cli
+from aligo.cli import _download_tree, _upload_tree
+
+
+class FakeFolder:
+    def __init__(self, file_id, name, file_type="folder"):
+        self.file_id = file_id
+        self.name = name
+        self.type = file_type
+
+
+class FakeUploadAli:
+    def __init__(self):
+        self._seq = 0
+        self._lock = threading.Lock()
+        self.created = []
+        self.uploaded = []
+
+    def create_folder(self, name, parent_file_id="root", drive_id=None, check_name_mode="auto_rename"):
+        self._seq += 1
+        folder = FakeFolder(file_id=f"id-{self._seq}", name=name)
+        self.created.append((parent_file_id, name, check_name_mode, folder.file_id))
+        return folder
+
+    def upload_file(self, file_path, parent_file_id="root", name=None, drive_id=None, check_name_mode="auto_rename"):
+        with self._lock:
+            self.uploaded.append((os.path.basename(file_path), parent_file_id, check_name_mode))
+        return FakeFolder(file_id=f"file-{os.path.basename(file_path)}", name=os.path.basename(file_path), file_type="file")
+
+
+class FakeDownloadAli:
+    def __init__(self):
+        self.children = {}
+        self.downloaded = []
+        self._lock = threading.Lock()
+
+    def add(self, parent_file_id, file_id, name, file_type="file"):
+        item = FakeFolder(file_id=file_id, name=name, file_type=file_type)
+        self.children.setdefault(parent_file_id, []).append(item)
+        return item
+
+    @staticmethod
+    def _del_special_symbol(s):
+        return s.replace(":", "_")
+
+    def get_file_list(self, parent_file_id="root", drive_id=None, **kwargs):
+        return list(self.children.get(parent_file_id, []))
+
+    def download_file(self, *, file=None, local_folder="."):
+        path = os.path.join(local_folder, file.name)
+        with self._lock:
+            self.downloaded.append(path)
+        return path
+
+
+class FakeBatchResult:
+    def __init__(self, file_id, status):
+        self.id = file_id
+        self.status = status
+
+    def to_dict(self):
+        return {"id": self.id, "status": self.status}
+
+
+class FakeTrashAli(FakeDownloadAli):
+    def __init__(self):
+        super().__init__()
+        self.trashed = []
+
+    def get_file(self, file_id, drive_id=None):
+        if file_id == "root":
+            return FakeFolder(file_id="root", name="/")
+        return next(item for items in self.children.values() for item in items if item.file_id == file_id)
+
+    def batch_move_to_trash(self, file_id_list, drive_id=None):
+        self.trashed.append(list(file_id_list))
+        return [FakeBatchResult(file_id, 404 if file_id == "gone" else 204) for file_id in file_id_list]
+
+
+def _touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write("x")
+
+
+def _names(results):
+    return [
+        {name: _names(children) for name, children in entry.items()} if isinstance(entry, dict) else entry.name
+        for entry in results
+    ]
+
+
+class UploadTreeTests(unittest.TestCase):
+    def test_creates_skeleton_and_uploads_every_file(self):
+        ali = FakeUploadAli()
+        with tempfile.TemporaryDirectory() as tmp:
+            root = os.path.join(tmp, "photos")
+            _touch(os.path.join(root, "a.txt"))
+            _touch(os.path.join(root, "2023", "b.txt"))
+            _touch(os.path.join(root, "2023", "jan", "c.txt"))
+
+            results = _upload_tree(ali, root, "parent-id", concurrency=4)
+
+        names = [(parent, name, mode) for parent, name, mode, _ in ali.created]
+        ids = {name: file_id for _, name, _, file_id in ali.created}
+        self.assertEqual(names[0], ("parent-id", "photos", "refuse"))
+        self.assertIn((ids["photos"], "2023", "refuse"), names)
+        self.assertIn((ids["2023"], "jan", "refuse"), names)
+        self.assertEqual(
+            sorted(ali.uploaded),
+            sorted([
+                ("a.txt", ids["photos"], "auto_rename"),
+                ("b.txt", ids["2023"], "auto_rename"),
+                ("c.txt", ids["jan"], "auto_rename"),
+            ]),
+        )
+        self.assertEqual(
+            _names(results),
+            ["a.txt", {"2023": ["b.txt", {"jan": ["c.txt"]}]}],
+        )
+
+    def test_follows_symlinked_folders(self):
+        ali = FakeUploadAli()
+        with tempfile.TemporaryDirectory() as tmp:
+            root = os.path.join(tmp, "root")
+            _touch(os.path.join(tmp, "other", "o.txt"))
+            os.makedirs(root)
+            os.symlink(os.path.join("..", "other"), os.path.join(root, "linked"))
+
+            results = _upload_tree(ali, root, "parent-id", concurrency=2)
+
+        self.assertEqual(_names(results), [{"linked": ["o.txt"]}])
+
+    def test_failed_upload_cancels_queued_uploads(self):
+        ali = FakeUploadAli()
+        failed = threading.Event()
+        original = ali.upload_file
+
+        def upload_file(file_path, **kwargs):
+            if os.path.basename(file_path) == "00.txt":
+                failed.set()
+                raise OSError("upload failed")
+            failed.wait(timeout=5)
+            return original(file_path, **kwargs)
+
+        ali.upload_file = upload_file
+        with tempfile.TemporaryDirectory() as tmp:
+            root = os.path.join(tmp, "many")
+            for i in range(40):
+                _touch(os.path.join(root, f"{i:02d}.txt"))
+
+            with self.assertRaises(OSError):
+                _upload_tree(ali, root, "parent-id", concurrency=2)
+
+        self.assertLess(len(ali.uploaded), 10)
+
+    def test_walk_error_raises(self):
+        ali = FakeUploadAli()
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(FileNotFoundError):
+                _upload_tree(ali, os.path.join(tmp, "missing"), "parent-id")
+
+
+class PutCommandTests(unittest.TestCase):
+    def setUp(self):
+        cli._PATH_CACHE.clear()
+
+    def test_warm_destination_costs_no_request(self):
+        ali = FakeUploadAli()
+        cli._path_cache_put(None, "/backup/2023", "cached-id", "folder")
+        with tempfile.TemporaryDirectory() as tmp:
+            local = os.path.join(tmp, "a.txt")
+            _touch(local)
+            args = argparse.Namespace(local_path=local, remote_path="/backup/2023/", drive_id=None,
+                                      check_name_mode="auto_rename", concurrency=1, json=False)
+            with mock.patch.object(cli, "_build_client", return_value=ali), redirect_stdout(io.StringIO()):
+                code = cli._cmd_put(args)
+
+        self.assertEqual(code, 0)
+        self.assertEqual(ali.created, [])
+        self.assertEqual(ali.uploaded, [("a.txt", "cached-id", "auto_rename")])
+
+
+class DownloadTreeTests(unittest.TestCase):
+    def test_mirrors_remote_tree_under_folder_name(self):
+        ali = FakeDownloadAli()
+        top = FakeFolder(file_id="top", name="back:up")
+        ali.add("top", "f1", "a.txt")
+        ali.add("top", "sub", "sub", file_type="folder")
+        ali.add("top", "empty", "empty", file_type="folder")
+        ali.add("sub", "f2", "b.txt")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            out = _download_tree(ali, top, tmp, concurrency=2)
+
+            root = os.path.join(tmp, "back_up")
+            self.assertEqual(out, os.path.abspath(root))
+            self.assertTrue(os.path.isdir(os.path.join(root, "empty")))
+            self.assertEqual(
+                sorted(ali.downloaded),
+                sorted([os.path.join(root, "a.txt"), os.path.join(root, "sub", "b.txt")]),
+            )
+
+    def test_parallel_download_hides_per_file_progress_bars(self):
+        ali = FakeDownloadAli()
+        top = FakeFolder(file_id="top", name="top")
+        ali.add("top", "f1", "a.txt")
+        seen = []
+        original = ali.download_file
+
+        def download_file(**kwargs):
+            seen.append(ali._DOWNLOAD_PROGRESS)
+            return original(**kwargs)
+
+        ali.download_file = download_file
+        ali._DOWNLOAD_PROGRESS = True
+        with tempfile.TemporaryDirectory() as tmp:
+            _download_tree(ali, top, tmp, concurrency=4)
+
+        self.assertEqual(seen, [False])
+        self.assertTrue(ali._DOWNLOAD_PROGRESS)
+
+    def test_failed_download_cancels_queued_downloads(self):
+        ali = FakeDownloadAli()
+        top = FakeFolder(file_id="top", name="top")
+        for i in range(40):
+            ali.add("top", f"f{i}", f"{i:02d}.txt")
+        failed = threading.Event()
+        original = ali.download_file
+
+        def download_file(*, file=None, local_folder="."):
+            if file.name == "00.txt":
+                failed.set()
+                raise OSError("download failed")
+            failed.wait(timeout=5)
+            return original(file=file, local_folder=local_folder)
+
+        ali.download_file = download_file
+        with tempfile.TemporaryDirectory() as tmp, redirect_stderr(io.StringIO()):
+            with self.assertRaises(OSError):
+                _download_tree(ali, top, tmp, concurrency=2)
+
+        self.assertLess(len(ali.downloaded), 10)
+
+
+class RemoveManyTests(unittest.TestCase):
+    def setUp(self):
+        cli._PATH_CACHE.clear()
+        self.ali = FakeTrashAli()
+        self.ali.add("root", "d1", "docs", file_type="folder")
+        self.ali.add("d1", "f1", "a.txt")
+        self.ali.add("root", "f2", "b.txt")
+        self.ali.add("root", "gone", "c.txt")
+
+    def run_rm(self, *paths):
+        args = argparse.Namespace(path=list(paths), concurrency=4, drive_id=None, json=False)
+        out = io.StringIO()
+        with mock.patch.object(cli, "_build_client", return_value=self.ali), redirect_stdout(out):
+            code = cli._cmd_rm(args)
+        return code, out.getvalue()
+
+    def test_trashes_all_targets_in_one_batch(self):
+        code, out = self.run_rm("/docs", "/docs/a.txt", "/b.txt", "/b.txt")
+
+        self.assertEqual(code, 0)
+        self.assertEqual(self.ali.trashed, [["d1", "f1", "f2"]])
+        self.assertEqual(out, "moved to trash: 3 items\n")
+        self.assertEqual(len(cli._PATH_CACHE), 0)
+
+    def test_reports_failed_items(self):
+        code, out = self.run_rm("/b.txt", "/c.txt")
+
+        self.assertEqual(code, 1)
+        self.assertEqual(out, "moved to trash: 1 items, failed: 1\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
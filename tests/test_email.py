@@ -0,0 +1,134 @@
+import smtplib
+import unittest
+from unittest import mock
+
+from aligo.core import EMail
+from aligo.core.EMail import send_emails
+
+
+class FakeSMTP:
+    """Stands in for smtplib.SMTP_SSL; `connects` and `script` list one outcome per connect / sendmail call."""
+    instances = []
+    connects = []
+    script = []
+
+    def __init__(self, host, port):
+        outcome = FakeSMTP.connects.pop(0) if FakeSMTP.connects else None
+        if isinstance(outcome, Exception):
+            raise outcome
+        self.closed = False
+        self.quitted = False
+        self.sent = []
+        FakeSMTP.instances.append(self)
+
+    def login(self, user, password):
+        pass
+
+    def sendmail(self, from_addr, to_addrs, msg):
+        if self.closed:
+            raise smtplib.SMTPServerDisconnected('please run connect() first')
+        outcome = FakeSMTP.script.pop(0) if FakeSMTP.script else {}
+        if isinstance(outcome, Exception):
+            raise outcome
+        self.sent.append((from_addr, to_addrs, msg))
+        return outcome
+
+    def close(self):
+        self.closed = True
+
+    def quit(self):
+        self.quitted = True
+        self.closed = True
+
+
+class SendEmailsTests(unittest.TestCase):
+    def setUp(self):
+        FakeSMTP.instances = []
+        FakeSMTP.connects = []
+        FakeSMTP.script = []
+        patchers = [mock.patch.object(EMail.smtplib, 'SMTP_SSL', FakeSMTP), mock.patch.object(EMail.time, 'sleep')]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def send(self, receivers):
+        return send_emails(receivers, 'title', 'content', b'png', 'bot@example.com', 'pw', 'smtp.example.com', 465)
+
+    def test_delivers_to_every_receiver_on_one_session(self):
+        results = self.send(['a@example.com', 'b@example.com'])
+
+        self.assertEqual(results, {'a@example.com': {}, 'b@example.com': {}})
+        self.assertEqual(len(FakeSMTP.instances), 1)
+        smtp = FakeSMTP.instances[0]
+        self.assertEqual([to for _, to, _ in smtp.sent], [['a@example.com'], ['b@example.com']])
+        self.assertTrue(smtp.quitted)
+
+    def test_reconnects_after_disconnect(self):
+        FakeSMTP.script = [smtplib.SMTPServerDisconnected('gone')]
+
+        results = self.send(['a@example.com', 'b@example.com'])
+
+        self.assertEqual(results, {'a@example.com': {}, 'b@example.com': {}})
+        first, second = FakeSMTP.instances
+        self.assertTrue(first.closed)
+        self.assertEqual(first.sent, [])
+        self.assertEqual([to for _, to, _ in second.sent], [['a@example.com'], ['b@example.com']])
+
+    def test_failed_reconnect_is_retried_next_round(self):
+        FakeSMTP.connects = [None, ConnectionRefusedError('smtp.example.com')]
+        FakeSMTP.script = [smtplib.SMTPServerDisconnected('gone')]
+
+        results = self.send(['a@example.com'])
+
+        self.assertEqual(results, {'a@example.com': {}})
+        first, second = FakeSMTP.instances
+        self.assertEqual(first.sent, [])
+        self.assertEqual(len(second.sent), 1)
+
+    def test_gives_up_after_retry_limit(self):
+        FakeSMTP.script = [smtplib.SMTPServerDisconnected('gone')] * 3
+
+        with self.assertRaises(RuntimeError):
+            self.send(['a@example.com'])
+        self.assertEqual(len(FakeSMTP.instances), 4)
+
+    def test_retry_limit_for_one_receiver_does_not_drop_the_others(self):
+        FakeSMTP.script = [smtplib.SMTPServerDisconnected('gone')] * 3
+
+        results = self.send(['a@example.com', 'b@example.com'])
+
+        self.assertEqual(results, {'a@example.com': {'a@example.com': (-1, b'gone')}, 'b@example.com': {}})
+        self.assertEqual([to for _, to, _ in FakeSMTP.instances[-1].sent], [['b@example.com']])
+
+    def test_address_payload_prepends_to_header(self):
+        payload = EMail.build_payload('title', 'content', b'png', 'bot@example.com')
+
+        addressed = EMail._address_payload(payload, '管理员 <admin@example.com>')
+
+        header, _, rest = addressed.partition(b'\n')
+        self.assertTrue(header.startswith(b'To: =?utf-8?'))
+        self.assertTrue(header.endswith(b' <admin@example.com>'))
+        self.assertEqual(rest, payload)
+
+    def test_refused_receiver_does_not_stop_the_others(self):
+        refused = {'bad@example.com': (550, b'no such user')}
+        FakeSMTP.script = [smtplib.SMTPRecipientsRefused(refused), smtplib.SMTPDataError(554, b'rejected')]
+
+        results = self.send(['bad@example.com', 'spam@example.com', 'ok@example.com'])
+
+        self.assertEqual(results, {
+            'bad@example.com': refused,
+            'spam@example.com': {'spam@example.com': (554, b'rejected')},
+            'ok@example.com': {},
+        })
+        self.assertEqual(len(FakeSMTP.instances), 1)
+
+    def test_raises_when_every_receiver_fails(self):
+        FakeSMTP.script = [smtplib.SMTPRecipientsRefused({'bad@example.com': (550, b'no such user')})]
+
+        with self.assertRaises(RuntimeError):
+            self.send(['bad@example.com'])
+
+
+if __name__ == '__main__':
+    unittest.main()